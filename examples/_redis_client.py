@@ -0,0 +1,115 @@
+"""
+Shared Redis client and JSON helpers for the SlackLiner Python examples.
+Requires: pip install redis (orjson optional, for faster serialization)
+
+Clients are cached per (host, port), so importing several example modules in
+one process still yields a single connection pool per Redis server.
+
+When Redis runs on the same host (REDIS_HOST is localhost or 127.0.0.1), set
+REDIS_UNIX_SOCKET to its socket path (e.g. /tmp/redis.sock, enabled with
+`unixsocket /tmp/redis.sock` in redis.conf) to connect over a UNIX domain
+socket instead of TCP loopback.
+"""
+
+import json
+import os
+import re
+import socket
+import types
+import redis
+from redis.backoff import NoBackoff
+from redis.retry import Retry
+
+# JSON backend: orjson when installed, otherwise the standard library.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the latter.
+try:
+    import orjson
+
+    loads = orjson.loads
+
+    def dumps(obj, ndjson: bool = False) -> bytes:
+        """Serialize obj to JSON bytes, newline-terminated when ndjson is set."""
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE if ndjson else None)
+except ImportError:
+    loads = json.loads
+
+    def dumps(obj, ndjson: bool = False) -> bytes:
+        """Serialize obj to JSON bytes, newline-terminated when ndjson is set."""
+        # Compact, non-ASCII-escaping output to match orjson
+        encoded = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+        return (encoded + "\n" if ndjson else encoded).encode()
+
+
+# Errors a push can be expected to raise: Redis failures (including connection
+# errors) and serialization errors (orjson.JSONEncodeError is a TypeError).
+# Anything else is a bug and is left to propagate.
+PUSH_ERRORS = (redis.RedisError, TypeError, ValueError)
+
+# Emoji name without colons (e.g. thumbsup, +1, +1::skin-tone-2), used with fullmatch
+# so adding and removing a reaction accept the same names
+REACTION_RE = re.compile(r"[a-z0-9_+\-]{1,64}(?:::skin-tone-[2-6])?")
+
+# Configuration from the environment, read once at import
+DEFAULTS = types.SimpleNamespace(
+    host=os.getenv("REDIS_HOST", "localhost"),
+    port=int(os.getenv("REDIS_PORT", "6379")),
+    key=os.getenv("REDIS_LIST_KEY", "slack_messages"),
+    reaction_key=os.getenv("REDIS_REACTION_LIST_KEY", "slack_reactions"),
+)
+_UNIX_SOCKET = os.getenv("REDIS_UNIX_SOCKET")
+
+# Hosts for which REDIS_UNIX_SOCKET is used instead of TCP
+_LOCAL_HOSTS = ("localhost", "127.0.0.1")
+
+# TCP keepalive tuning for pooled connections (options missing on this platform are skipped)
+_KEEPALIVE_OPTIONS = {
+    getattr(socket, name): value
+    for name, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, name)
+}
+
+# Redis clients keyed by (host, port) so repeated calls share one connection pool
+_CLIENTS = {}
+
+
+def get_client(host: str = None, port: int = None, **kw) -> redis.Redis:
+    """
+    Return the shared Redis client for host:port, creating it on first use.
+
+    Replies are not decoded, which suits the write-only producers here (RPUSH
+    returns an int either way). Code that reads values back should create its
+    own client with decode_responses=True rather than sharing this one.
+
+    Args:
+        host: Redis host address (defaults to REDIS_HOST, or localhost)
+        port: Redis port number (defaults to REDIS_PORT, or 6379)
+        **kw: Extra redis.Redis arguments, only applied when the client is created
+
+    Returns:
+        redis.Redis: Client backed by a connection pool of up to 16 connections
+    """
+    host = host if host is not None else DEFAULTS.host
+    port = port if port is not None else DEFAULTS.port
+    client = _CLIENTS.get((host, port))
+    if client is None:
+        options = {
+            "decode_responses": False,
+            "max_connections": 16,
+            # Bound how long a push (including the atexit flush in push_message) can block on
+            # an unreachable or unresponsive server. The explicit single retry matters: with
+            # health checks enabled, redis-py's default retries nest and one command against a
+            # silent server can take over a hundred timeouts before failing.
+            "socket_timeout": 5,
+            "socket_connect_timeout": 5,
+            "retry": Retry(NoBackoff(), 1),
+            "health_check_interval": 30,
+        }
+        if _UNIX_SOCKET and host in _LOCAL_HOSTS:
+            options["unix_socket_path"] = _UNIX_SOCKET
+        else:
+            options.update(host=host, port=port, socket_keepalive=True,
+                           socket_keepalive_options=_KEEPALIVE_OPTIONS)
+        options.update(kw)
+        client = redis.Redis(**options)
+        _CLIENTS[(host, port)] = client
+    return client
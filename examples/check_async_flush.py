@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Self-check that push_message's background sender cannot hang flush() forever.
+Requires: pip install redis (no Redis server needed)
+
+Starts a local TCP server that accepts connections but never replies, queues
+several batches' worth of messages with async_flush=True against it and
+checks that flush() (the same call registered with atexit) gives up within
+its overall timeout instead of waiting on every batch in turn.
+
+Usage: python check_async_flush.py
+"""
+
+import logging
+import socket
+import sys
+import threading
+import time
+
+import push_message
+from _redis_client import get_client
+
+# Each batch takes about 20s to fail, so without flush()'s overall timeout
+# MESSAGES would take about a minute; allow a little slack over the timeout
+MESSAGES = push_message.ASYNC_BATCH_SIZE * 3 + 100
+MAX_FLUSH_SECONDS = push_message.FLUSH_TIMEOUT_SECONDS + 5
+
+
+def _start_silent_server() -> int:
+    """Listen on a free local port, accepting connections and never answering; return the port."""
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    accepted = []
+
+    def accept_forever():
+        while True:
+            conn, _ = server.accept()
+            accepted.append(conn)
+
+    threading.Thread(target=accept_forever, daemon=True).start()
+    return server.getsockname()[1]
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING, format="  %(message)s")
+
+    port = _start_silent_server()
+    client = get_client("127.0.0.1", port)
+    for i in range(MESSAGES):
+        push_message.push_message("#general", f"self-check {i}", client=client, async_flush=True)
+
+    started = time.monotonic()
+    dropped = push_message.flush()
+    elapsed = time.monotonic() - started
+
+    if elapsed > MAX_FLUSH_SECONDS:
+        print(f"✗ flush() took {elapsed:.1f}s (limit {MAX_FLUSH_SECONDS}s)")
+        sys.exit(1)
+    if not dropped:
+        print("✗ flush() reported no dropped messages although Redis never answered")
+        sys.exit(1)
+    print(f"✓ flush() returned after {elapsed:.1f}s with Redis unresponsive, dropping {dropped} of {MESSAGES}")
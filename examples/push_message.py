@@ -1,21 +1,180 @@
 #!/usr/bin/env python3
 """
 Example script to push messages to Redis for SlackLiner to process.
-Requires: pip install redis
+Requires: pip install redis (orjson optional, for faster serialization)
+
+Connections are shared with the other examples through _redis_client.py; see
+its docstring for connecting to a local Redis over a UNIX domain socket.
 """
 
+import atexit
+import functools
 import json
-import os
+import logging
+import queue
+import re
 import sys
+import threading
+import time
 import redis
 
+from _redis_client import (DEFAULTS, PUSH_ERRORS as _PUSH_ERRORS, dumps as _dumps, get_client as _get_client,
+                           loads as _loads)
+
+log = logging.getLogger(__name__)
+
+# Slack channel name (optionally prefixed with # or @) or conversation ID, used with fullmatch
+_CHANNEL_RE = re.compile(r"[#@]?[A-Za-z0-9._-]{1,80}|[CDG][A-Z0-9]{8,}")
+
+# Maximum number of values sent in a single RPUSH, keeping each command well
+# under proto-max-bulk-len and short enough not to stall the Redis event loop
+RPUSH_CHUNK_SIZE = 4096
+
+# Maximum number of queued messages sent per pipeline by the background sender
+ASYNC_BATCH_SIZE = 500
+
+# Default overall time flush() (and so the atexit hook) waits for queued messages
+FLUSH_TIMEOUT_SECONDS = 30
+
+# (client, list key, payload) tuples waiting for the background sender
+_ASYNC_QUEUE = queue.Queue()
+_async_sender = None
+_async_sender_lock = threading.Lock()
+
+
+def _send_async_batch(batch: list) -> None:
+    """Send queued messages with one non-transactional pipeline per client."""
+    pipes = {}
+    for r, redis_list_key, payload in batch:
+        pipe = pipes.get(id(r))
+        if pipe is None:
+            pipe = pipes[id(r)] = r.pipeline(transaction=False)
+        pipe.rpush(redis_list_key, payload)
+    for pipe in pipes.values():
+        try:
+            pipe.execute()
+        # Deliberately broad: an uncaught error would stop the sender thread and leave flush() waiting forever
+        except Exception as e:
+            log.error("Error sending queued messages: %s", e)
+
+
+def _async_sender_loop() -> None:
+    """Block for queued messages and send them in batches of up to ASYNC_BATCH_SIZE."""
+    while True:
+        batch = [_ASYNC_QUEUE.get()]
+        while len(batch) < ASYNC_BATCH_SIZE:
+            try:
+                batch.append(_ASYNC_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            _send_async_batch(batch)
+        finally:
+            for _ in batch:
+                _ASYNC_QUEUE.task_done()
+
+
+def _ensure_async_sender() -> None:
+    """Start the background sender thread on first use."""
+    global _async_sender
+    if _async_sender is not None:
+        return
+    with _async_sender_lock:
+        if _async_sender is None:
+            _async_sender = threading.Thread(target=_async_sender_loop, name="slackliner-sender", daemon=True)
+            _async_sender.start()
+
+
+def flush(timeout: float = FLUSH_TIMEOUT_SECONDS) -> int:
+    """
+    Wait until every message queued with async_flush=True has been sent, or timeout passes.
+    
+    Against an unreachable Redis each batch only fails after the socket timeouts
+    set by _redis_client.get_client, so a long queue could otherwise keep the
+    process alive at exit for a long time. Once timeout seconds have passed,
+    messages still queued are discarded and logged as dropped; a batch already
+    being sent at that point is lost if the process then exits.
+    check_async_flush.py exercises this against an unresponsive server.
+    
+    Args:
+        timeout: Maximum number of seconds to wait
+    
+    Returns:
+        int: Number of queued messages dropped because the timeout passed
+    """
+    if _async_sender is None:
+        return 0
+    
+    deadline = time.monotonic() + timeout
+    with _ASYNC_QUEUE.all_tasks_done:
+        while _ASYNC_QUEUE.unfinished_tasks:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            _ASYNC_QUEUE.all_tasks_done.wait(remaining)
+        else:
+            return 0
+    
+    dropped = 0
+    while True:
+        try:
+            _ASYNC_QUEUE.get_nowait()
+        except queue.Empty:
+            break
+        _ASYNC_QUEUE.task_done()
+        dropped += 1
+    if dropped:
+        log.error("Dropped %d queued messages after waiting %ss for Redis", dropped, timeout)
+    return dropped
+
+
+atexit.register(flush)
+
+
+def _valid_channel(channel: str) -> bool:
+    """Return True if channel looks like a Slack channel name or ID, logging an error otherwise."""
+    if isinstance(channel, str) and _CHANNEL_RE.fullmatch(channel):
+        return True
+    log.error("Invalid channel: %r", channel)
+    return False
+
+
+@functools.lru_cache(maxsize=1024)
+def _message_prefix(channel: str) -> bytes:
+    """Return the serialized payload up to the text value, cached since few distinct channels are used."""
+    return b'{"channel":' + _dumps(channel) + b',"text":'
+
+
+def _encode_message(channel: str, text: str, ttl: int = None, metadata: dict = None,
+                    ndjson: bool = False) -> bytes:
+    """
+    Serialize a message payload, splicing the encoded fields onto the cached channel prefix.
+    
+    This is the only message encoder; ttl is left out unless positive and
+    metadata unless non-empty.
+    """
+    payload = _message_prefix(channel) + _dumps(text)
+    if ttl is not None and ttl > 0:
+        payload += b',"ttl":' + _dumps(ttl)
+    if metadata:
+        payload += b',"metadata":' + _dumps(metadata)
+    return payload + (b'}\n' if ndjson else b'}')
+
 
 def push_message(channel: str, text: str, redis_host: str = "localhost", 
                  redis_port: int = 6379, redis_list_key: str = "slack_messages",
-                 ttl: int = None, metadata: dict = None) -> bool:
+                 ttl: int = None, metadata: dict = None,
+                 client: redis.Redis = None, async_flush: bool = False, ndjson: bool = False) -> bool:
     """
     Push a Slack message to Redis queue.
     
+    With async_flush=True the message is handed to a background thread and the
+    call returns without waiting for Redis. Queued messages are sent in
+    pipelined batches, which raises throughput but means a message is not
+    acknowledged by Redis when this function returns: errors are only logged
+    by the sender thread, and messages still queued are lost if the process is
+    killed before flush() runs (it is registered with atexit).
+    
     Args:
         channel: Slack channel name (e.g., '#general') or ID
         text: Message text to send
@@ -24,46 +183,286 @@ def push_message(channel: str, text: str, redis_host: str = "localhost",
         redis_list_key: Redis list key to push to
         ttl: Optional time-to-live in seconds for automatic deletion via TimeBomb
         metadata: Optional metadata dict with 'event_type' and 'event_payload' keys
+        client: Optional Redis client to use instead of the shared one for redis_host:redis_port
+        async_flush: Queue the message for the background sender instead of waiting for Redis
+        ndjson: Terminate the payload with a newline for consumers that stream line-delimited JSON
     
     Returns:
-        bool: True if successful, False otherwise
+        bool: True if successful (or queued), False otherwise
     """
+    if not _valid_channel(channel):
+        return False
+    
     try:
-        # Connect to Redis
-        r = redis.Redis(host=redis_host, port=redis_port, decode_responses=True)
+        # Reuse the shared Redis client unless one was supplied
+        r = client if client is not None else _get_client(redis_host, redis_port)
         
-        # Create message payload
-        message = {
-            "channel": channel,
-            "text": text
-        }
+        payload = _encode_message(channel, text, ttl, metadata, ndjson)
+        event_type = metadata.get("event_type") if isinstance(metadata, dict) else None
         
-        # Add TTL if provided
-        if ttl is not None and ttl > 0:
-            message["ttl"] = ttl
-        
-        # Add metadata if provided
-        if metadata:
-            message["metadata"] = metadata
+        if async_flush:
+            _ASYNC_QUEUE.put((r, redis_list_key, payload))
+            _ensure_async_sender()
+            return True
         
         # Push to Redis list
-        r.rpush(redis_list_key, json.dumps(message))
-        print(f"✓ Message pushed to Redis queue '{redis_list_key}'")
-        if ttl:
-            print(f"  with TTL: {ttl} seconds")
-        if metadata:
-            print(f"  with metadata event_type: {metadata.get('event_type', 'N/A')}")
+        r.rpush(redis_list_key, payload)
+        log.info("Message pushed to Redis queue '%s' (ttl=%s, event_type=%s)", redis_list_key, ttl, event_type)
+        return True
+        
+    except _PUSH_ERRORS as e:
+        log.error("Error: %s", e)
+        return False
+
+
+def _rpush_payloads(r: redis.Redis, payloads_by_key: dict) -> None:
+    """
+    Append encoded payloads to their lists with variadic RPUSHes of up to RPUSH_CHUNK_SIZE values.
+    
+    A single RPUSH is sent directly; anything more shares one non-transactional
+    pipeline, so the whole call costs a single round-trip.
+    """
+    commands = [
+        (list_key, payloads[start:start + RPUSH_CHUNK_SIZE])
+        for list_key, payloads in payloads_by_key.items()
+        for start in range(0, len(payloads), RPUSH_CHUNK_SIZE)
+    ]
+    if len(commands) == 1:
+        r.rpush(commands[0][0], *commands[0][1])
+        return
+    pipe = r.pipeline(transaction=False)
+    for list_key, chunk in commands:
+        pipe.rpush(list_key, *chunk)
+    pipe.execute()
+
+
+def push_messages(messages: list, redis_host: str = "localhost", redis_port: int = 6379,
+                  redis_list_key: str = "slack_messages", client: redis.Redis = None,
+                  ndjson: bool = False) -> bool:
+    """
+    Push several Slack messages to one Redis queue in a single round-trip.
+    
+    Each message is sent as-is, so it should already have the shape SlackLiner
+    expects (at least 'channel' and 'text'). Messages are appended in order with
+    one variadic RPUSH per RPUSH_CHUNK_SIZE messages.
+    
+    Args:
+        messages: List of message dicts to push
+        redis_host: Redis host address
+        redis_port: Redis port number
+        redis_list_key: Redis list key to push to
+        client: Optional Redis client to use instead of the shared one for redis_host:redis_port
+        ndjson: Terminate each payload with a newline for consumers that stream line-delimited JSON
+    
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    return push_messages_multi({redis_list_key: messages}, redis_host, redis_port, client, ndjson)
+
+
+def push_messages_multi(messages_by_key: dict, redis_host: str = "localhost", redis_port: int = 6379,
+                        client: redis.Redis = None, ndjson: bool = False) -> bool:
+    """
+    Push Slack messages to several Redis queues in a single round-trip.
+    
+    Args:
+        messages_by_key: Dict mapping each Redis list key to the message dicts to push to it
+        redis_host: Redis host address
+        redis_port: Redis port number
+        client: Optional Redis client to use instead of the shared one for redis_host:redis_port
+        ndjson: Terminate each payload with a newline for consumers that stream line-delimited JSON
+    
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        payloads_by_key = {
+            list_key: [_dumps(message, ndjson) for message in messages]
+            for list_key, messages in messages_by_key.items()
+            if messages
+        }
+        if not payloads_by_key:
+            return True
+        
+        r = client if client is not None else _get_client(redis_host, redis_port)
+        _rpush_payloads(r, payloads_by_key)
+        if log.isEnabledFor(logging.INFO):
+            log.info("%d messages pushed to %d Redis queue(s)",
+                     sum(len(payloads) for payloads in payloads_by_key.values()), len(payloads_by_key))
         return True
         
-    except redis.ConnectionError as e:
-        print(f"✗ Failed to connect to Redis: {e}")
+    except _PUSH_ERRORS as e:
+        log.error("Error: %s", e)
         return False
-    except Exception as e:
-        print(f"✗ Error: {e}")
+
+
+def make_pusher(channel: str, r: redis.Redis, redis_list_key: str = "slack_messages",
+                ndjson: bool = False):
+    """
+    Build a function that pushes messages to one channel with a fixed client and list key.
+    
+    Channel validation and client lookup happen once here; each call only
+    encodes the message with the same encoder push_message uses.
+    
+    Args:
+        channel: Slack channel name (e.g., '#general') or ID
+        r: Redis client to push with
+        redis_list_key: Redis list key to push to
+        ndjson: Terminate each payload with a newline for consumers that stream line-delimited JSON
+    
+    Returns:
+        A function pusher(text, ttl=None, metadata=None) -> bool
+    
+    Raises:
+        ValueError: If channel is not a valid Slack channel name or ID
+    """
+    if not _valid_channel(channel):
+        raise ValueError(f"Invalid channel: {channel!r}")
+    
+    def pusher(text: str, ttl: int = None, metadata: dict = None) -> bool:
+        try:
+            r.rpush(redis_list_key, _encode_message(channel, text, ttl, metadata, ndjson))
+            return True
+        except _PUSH_ERRORS as e:
+            log.error("Error: %s", e)
+            return False
+    
+    return pusher
+
+
+# Seconds to wait before retrying a push_message_batched buffer whose push failed
+BATCH_RETRY_SECONDS = 5
+
+# Most messages a push_message_batched buffer keeps while Redis is failing; the oldest are dropped beyond it
+BATCH_MAX_BUFFERED = 10000
+
+# Messages buffered by push_message_batched, keyed by (client id, list key)
+_BATCHES = {}
+_batches_lock = threading.Lock()
+
+
+def _push_batch(batch_key: tuple, batch: dict) -> bool:
+    """Push one push_message_batched buffer, returning False (and logging) on failure."""
+    try:
+        _rpush_payloads(batch["client"], {batch_key[1]: batch["payloads"]})
+        log.info("%d buffered messages pushed to Redis queue '%s'", len(batch["payloads"]), batch_key[1])
+        return True
+    except _PUSH_ERRORS as e:
+        log.error("Error: %s", e)
         return False
 
 
+def _restore_batch(batch_key: tuple, batch: dict) -> None:
+    """
+    Put a buffer whose push failed back in _BATCHES, ahead of anything buffered meanwhile.
+    
+    The buffer is not retried for BATCH_RETRY_SECONDS and is capped at
+    BATCH_MAX_BUFFERED messages, dropping the oldest.
+    """
+    with _batches_lock:
+        current = _BATCHES.get(batch_key)
+        if current is not None:
+            batch["payloads"].extend(current["payloads"])
+        overflow = len(batch["payloads"]) - BATCH_MAX_BUFFERED
+        if overflow > 0:
+            del batch["payloads"][:overflow]
+            log.error("Dropped %d buffered messages for Redis queue '%s'", overflow, batch_key[1])
+        batch["retry_at"] = time.monotonic() + BATCH_RETRY_SECONDS
+        _BATCHES[batch_key] = batch
+
+
+def push_message_batched(channel: str, text: str, redis_host: str = "localhost",
+                         redis_port: int = 6379, redis_list_key: str = "slack_messages",
+                         ttl: int = None, metadata: dict = None, client: redis.Redis = None,
+                         max_items: int = 100, max_delay_ms: int = 50, ndjson: bool = False) -> bool:
+    """
+    Buffer a Slack message and push the buffer once it is full or old enough.
+    
+    The buffer is pushed when it holds max_items messages or
+    when its oldest message has waited at least max_delay_ms. The age check only
+    runs when a new message is added; flush_batched() pushes whatever is still
+    buffered and is registered with atexit.
+    
+    The push runs outside the buffer lock, so other producers keep buffering
+    while it is in flight. If it fails the error is logged and the messages go
+    back into the buffer, to be retried by a call made at least
+    BATCH_RETRY_SECONDS later or by flush_batched(). While Redis keeps failing
+    the buffer holds at most BATCH_MAX_BUFFERED messages, dropping the oldest.
+    
+    Args:
+        channel: Slack channel name (e.g., '#general') or ID
+        text: Message text to send
+        redis_host: Redis host address
+        redis_port: Redis port number
+        redis_list_key: Redis list key to push to
+        ttl: Optional time-to-live in seconds for automatic deletion via TimeBomb
+        metadata: Optional metadata dict with 'event_type' and 'event_payload' keys
+        client: Optional Redis client to use instead of the shared one for redis_host:redis_port
+        max_items: Number of buffered messages that triggers a flush
+        max_delay_ms: Age in milliseconds of the oldest buffered message that triggers a flush
+        ndjson: Terminate the payload with a newline for consumers that stream line-delimited JSON
+    
+    Returns:
+        bool: True once the message is buffered (even if pushing the buffer failed and
+        will be retried), False if the message was rejected
+    """
+    if not _valid_channel(channel):
+        return False
+    
+    try:
+        payload = _encode_message(channel, text, ttl, metadata, ndjson)
+        r = client if client is not None else _get_client(redis_host, redis_port)
+    except _PUSH_ERRORS as e:
+        log.error("Error: %s", e)
+        return False
+    
+    batch_key = (id(r), redis_list_key)
+    with _batches_lock:
+        batch = _BATCHES.get(batch_key)
+        if batch is None:
+            batch = _BATCHES[batch_key] = {"client": r, "started": time.monotonic(), "retry_at": 0,
+                                           "payloads": []}
+        batch["payloads"].append(payload)
+        
+        now = time.monotonic()
+        if now < batch["retry_at"]:
+            return True
+        if len(batch["payloads"]) < max_items and (now - batch["started"]) * 1000 < max_delay_ms:
+            return True
+        del _BATCHES[batch_key]
+    
+    if not _push_batch(batch_key, batch):
+        _restore_batch(batch_key, batch)
+    return True
+
+
+def flush_batched() -> bool:
+    """
+    Push every message still buffered by push_message_batched.
+    
+    Buffers that fail to push are put back, so a later call can retry them.
+    
+    Returns:
+        bool: True if all buffers were pushed successfully, False otherwise
+    """
+    with _batches_lock:
+        batches = list(_BATCHES.items())
+        _BATCHES.clear()
+    
+    success = True
+    for batch_key, batch in batches:
+        if not _push_batch(batch_key, batch):
+            _restore_batch(batch_key, batch)
+            success = False
+    return success
+
+
+atexit.register(flush_batched)
+
+
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING, format="✗ %(message)s")
+    
     if len(sys.argv) < 3:
         print("Usage: python push_message.py <channel> <text> [ttl] [event_type] [event_payload_json]")
         print("Example (simple): python push_message.py '#general' 'Hello from SlackLiner!'")
@@ -94,7 +493,7 @@ if __name__ == "__main__":
         event_payload = {}
         if len(sys.argv) >= 6:
             try:
-                event_payload = json.loads(sys.argv[5])
+                event_payload = _loads(sys.argv[5])
             except json.JSONDecodeError as e:
                 print(f"✗ Invalid JSON for event_payload: {e}")
                 sys.exit(1)
@@ -104,10 +503,18 @@ if __name__ == "__main__":
             "event_payload": event_payload
         }
     
-    # Get config from environment variables
-    redis_host = os.getenv("REDIS_HOST", "localhost")
-    redis_port = int(os.getenv("REDIS_PORT", "6379"))
-    redis_list_key = os.getenv("REDIS_LIST_KEY", "slack_messages")
+    # Config from environment variables, parsed by _redis_client at import
+    redis_host = DEFAULTS.host
+    redis_port = DEFAULTS.port
+    redis_list_key = DEFAULTS.key
     
     success = push_message(channel, text, redis_host, redis_port, redis_list_key, ttl, metadata)
+    if success:
+        # Emit the summary in one write, since this script is often run in shell loops
+        lines = [f"✓ Message pushed to Redis queue '{redis_list_key}'"]
+        if ttl:
+            lines.append(f"  with TTL: {ttl} seconds")
+        if metadata:
+            lines.append(f"  with metadata event_type: {metadata['event_type']}")
+        sys.stdout.write("\n".join(lines) + "\n")
     sys.exit(0 if success else 1)
@@ -1,17 +1,25 @@
 #!/usr/bin/env python3
 """
 Example script to push emoji reactions to Redis for SlackLiner to process.
-Requires: pip install redis
+Requires: pip install redis (orjson optional, for faster serialization)
+
+Connections are shared with the other examples through _redis_client.py; see
+its docstring for connecting to a local Redis over a UNIX domain socket.
 """
 
-import json
-import os
+import logging
 import sys
 import redis
 
+from _redis_client import (DEFAULTS, PUSH_ERRORS as _PUSH_ERRORS, REACTION_RE as _REACTION_RE, dumps as _dumps,
+                           get_client as _get_client)
+
+log = logging.getLogger(__name__)
+
 
 def push_reaction(reaction: str, channel: str, ts: str, redis_host: str = "localhost",
-                  redis_port: int = 6379, redis_list_key: str = "slack_reactions") -> bool:
+                  redis_port: int = 6379, redis_list_key: str = "slack_reactions",
+                  client: redis.Redis = None) -> bool:
     """
     Push an emoji reaction to Redis queue.
     
@@ -22,13 +30,18 @@ def push_reaction(reaction: str, channel: str, ts: str, redis_host: str = "local
         redis_host: Redis host address
         redis_port: Redis port number
         redis_list_key: Redis list key to push to
+        client: Optional Redis client to use instead of the shared one for redis_host:redis_port
     
     Returns:
         bool: True if successful, False otherwise
     """
+    if not (isinstance(reaction, str) and _REACTION_RE.fullmatch(reaction)):
+        log.error("Invalid reaction: %r", reaction)
+        return False
+    
     try:
-        # Connect to Redis
-        r = redis.Redis(host=redis_host, port=redis_port, decode_responses=True)
+        # Reuse the shared Redis client unless one was supplied
+        r = client if client is not None else _get_client(redis_host, redis_port)
         
         # Create reaction payload
         reaction_message = {
@@ -38,21 +51,19 @@ def push_reaction(reaction: str, channel: str, ts: str, redis_host: str = "local
         }
         
         # Push to Redis list
-        r.rpush(redis_list_key, json.dumps(reaction_message))
-        print(f"✓ Reaction '{reaction}' pushed to Redis queue '{redis_list_key}'")
-        print(f"  Channel: {channel}")
-        print(f"  Timestamp: {ts}")
+        r.rpush(redis_list_key, _dumps(reaction_message))
+        log.info("Reaction '%s' pushed to Redis queue '%s' (channel=%s, ts=%s)",
+                 reaction, redis_list_key, channel, ts)
         return True
         
-    except redis.ConnectionError as e:
-        print(f"✗ Failed to connect to Redis: {e}")
-        return False
-    except Exception as e:
-        print(f"✗ Error: {e}")
+    except _PUSH_ERRORS as e:
+        log.error("Error: %s", e)
         return False
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING, format="✗ %(message)s")
+    
     if len(sys.argv) != 4:
         print("Usage: python push_reaction.py <reaction> <channel> <timestamp>")
         print()
@@ -74,10 +85,17 @@ if __name__ == "__main__":
     channel = sys.argv[2]
     ts = sys.argv[3]
     
-    # Get config from environment variables
-    redis_host = os.getenv("REDIS_HOST", "localhost")
-    redis_port = int(os.getenv("REDIS_PORT", "6379"))
-    redis_list_key = os.getenv("REDIS_REACTION_LIST_KEY", "slack_reactions")
+    # Config from environment variables, parsed by _redis_client at import
+    redis_host = DEFAULTS.host
+    redis_port = DEFAULTS.port
+    redis_list_key = DEFAULTS.reaction_key
     
     success = push_reaction(reaction, channel, ts, redis_host, redis_port, redis_list_key)
+    if success:
+        # Emit the summary in one write, since this script is often run in shell loops
+        sys.stdout.write(
+            f"✓ Reaction '{reaction}' pushed to Redis queue '{redis_list_key}'\n"
+            f"  Channel: {channel}\n"
+            f"  Timestamp: {ts}\n"
+        )
     sys.exit(0 if success else 1)